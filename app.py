@@ -35,7 +35,7 @@ with editor_col:
 with assistant_col:
     st.subheader("Code Assistant")
     render_chatbot(
-        st.session_state.code,
+        st.session_state.project_code if st.session_state.get("project_mode") else st.session_state.code,
         st.session_state.get("stdin", ""),
         st.session_state.get("code_output", ""),
         st.session_state.get("error_output", "")
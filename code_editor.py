@@ -4,8 +4,12 @@ import streamlit as st
 import streamlit_ace as st_ace
 import os
 import time, psutil
+import hashlib
 from pathlib import Path
-from utils import execute_code
+from utils import (
+    execute_code, execute_project, load_project_archive, build_project_archive,
+    normalize_project_path, MAX_PROJECT_BYTES
+)
 
 # Default code snippets
 DEFAULT_SNIPPETS = {
@@ -27,6 +31,17 @@ EXT_LANG_MAP = {
     ".cs": "C#"
 }
 
+# Project mode: entry file names tried first, and the file each language starts with
+ENTRY_CANDIDATES = ["main.py", "main.c", "main.cpp", "Main.java", "index.js", "main.js", "Program.cs"]
+LANG_ENTRY_FILE = {
+    "Python": "main.py", "C": "main.c", "C++": "main.cpp",
+    "Java": "Main.java", "JavaScript": "index.js", "C#": "Program.cs"
+}
+ACE_MODES = {
+    ".py": "python", ".c": "c_cpp", ".h": "c_cpp", ".cpp": "c_cpp", ".hpp": "c_cpp",
+    ".java": "java", ".js": "javascript", ".cs": "csharp"
+}
+
 def render_code_editor(ace_theme):
     # ── Language Selector ──────────────────────────────
     lang_list = list(DEFAULT_SNIPPETS.keys())
@@ -35,6 +50,11 @@ def render_code_editor(ace_theme):
     st.session_state.language = selected_lang
     editor_key = f"editor_{selected_lang}"
 
+    # ── Project Mode ──────────────────────────────
+    if st.toggle("🗂️ Project mode", key="project_mode", help="Work with a multi-file project"):
+        render_project_editor(ace_theme, selected_lang)
+        return
+
     # ── File Upload ──────────────────────────────
     uploaded_file = st.file_uploader("📤 Upload file", type=["py", "cpp", "c", "java", "js", "cs", "txt"])
 
@@ -100,40 +120,15 @@ def render_code_editor(ace_theme):
         st.session_state.code = code
 
     # ── Stdin Input ──────────────────────────────
-    user_input = st.text_area(
-        "📥 Input (stdin)",
-        value=st.session_state.stdin,
-        height=100,
-        placeholder="Enter input values, one per line",
-        key="stdin_input"
-    )
-    if user_input != st.session_state.stdin:
-        st.session_state.stdin = user_input
+    _render_stdin()
 
     # ── Run Button ──────────────────────────────
     if st.button("▶️ Run"):
-        start_time = time.perf_counter()
-        process = psutil.Process()
-        mem_before = process.memory_info().rss
-
-        out, err, exc = execute_code(
+        _run_and_report(lambda: execute_code(
             code=st.session_state.code,
             stdin=st.session_state.stdin,
             language=selected_lang
-        )
-
-        exec_time = time.perf_counter() - start_time
-        mem_after = process.memory_info().rss
-        mem_used = (mem_after - mem_before) / 1024
-
-        st.session_state.code_output = out
-        st.session_state.error_output = err or exc
-
-        st.text_area("📤 Output", out or "(no output)", height=120)
-        if err or exc:
-            st.error(err or exc)
-        st.markdown(f"⏱️ **Execution Time:** {exec_time:.4f}s")
-        st.markdown(f"💾 **Memory Used:** {mem_used:.2f} KB")
+        ))
 
     # ── Download Code ──────────────────────────────
     if st.session_state.code:
@@ -148,4 +143,166 @@ def render_code_editor(ace_theme):
             data=st.session_state.code,
             file_name=f"code.{ext}",
             mime="text/plain"
-        )
\ No newline at end of file
+        )
+
+def render_project_editor(ace_theme, selected_lang):
+    # ── Project Upload ──────────────────────────────
+    uploaded_zip = st.file_uploader("📦 Upload project (.zip)", type=["zip"], key="project_upload")
+
+    if uploaded_zip:
+        if uploaded_zip.size > MAX_PROJECT_BYTES:
+            st.error(f"🚫 File too large. Max allowed is {MAX_PROJECT_BYTES // (1024 * 1024)}MB.")
+        else:
+            data = uploaded_zip.getvalue()
+            digest = hashlib.sha256(data).hexdigest()
+
+            # Only react to new uploads
+            if digest != st.session_state.get("uploaded_project_digest"):
+                st.session_state.uploaded_project_digest = digest
+                try:
+                    files = load_project_archive(data, uploaded_zip.name)
+                except Exception as e:
+                    st.error(f"❌ Could not read project: {e}")
+                    return
+                if not files:
+                    st.error("❌ The archive contains no files.")
+                    return
+
+                entry = _guess_entry(files)
+                st.session_state.project_files = files
+                st.session_state.project_entry = entry
+                st.session_state.project_current = entry
+                detected_lang = EXT_LANG_MAP.get(Path(entry).suffix.lower())
+                if detected_lang:
+                    st.session_state.language = detected_lang
+                    st.session_state.prev_language = detected_lang
+                st.toast(f"✅ Loaded {len(files)} files", icon="📦")
+                st.rerun()
+
+    # ── Virtual File Tree ──────────────────────────────
+    files = st.session_state.project_files
+    if not files:
+        # Start the project from whatever is in the single-file editor
+        name = LANG_ENTRY_FILE[selected_lang]
+        files[name] = st.session_state.code or DEFAULT_SNIPPETS[selected_lang]
+        st.session_state.project_entry = name
+        st.session_state.project_current = name
+
+    paths = sorted(files)
+    current_path = st.session_state.get("project_current")
+    file_col, new_col = st.columns([3, 2])
+    with file_col:
+        current = st.selectbox(
+            "📁 File", paths,
+            index=paths.index(current_path) if current_path in paths else 0
+        )
+    st.session_state.project_current = current
+
+    with new_col:
+        new_path = st.text_input("➕ New file", placeholder="src/helpers.h", key="project_new_file")
+        add_col, del_col = st.columns(2)
+        if add_col.button("Add") and new_path.strip():
+            try:
+                new_path = normalize_project_path(new_path.strip())
+            except ValueError as e:
+                st.error(f"❌ {e}")
+            else:
+                if new_path in files:
+                    st.error("❌ File already exists.")
+                else:
+                    files[new_path] = ""
+                    st.session_state.project_current = new_path
+                    st.rerun()
+        if del_col.button("Delete", disabled=len(files) < 2):
+            del files[current]
+            if st.session_state.project_entry == current:
+                st.session_state.project_entry = _guess_entry(files)
+            st.session_state.project_current = None
+            st.rerun()
+
+    sources = [path for path in paths if Path(path).suffix.lower() in EXT_LANG_MAP] or paths
+    entry = st.session_state.get("project_entry")
+    entry = st.selectbox(
+        "🚀 Entry file", sources,
+        index=sources.index(entry) if entry in sources else 0
+    )
+    st.session_state.project_entry = entry
+    project_lang = EXT_LANG_MAP.get(Path(entry).suffix.lower(), selected_lang)
+
+    # ── ACE Code Editor ──────────────────────────────
+    code = st_ace.st_ace(
+        value=files[current],
+        placeholder=f"Start typing {current}…",
+        language=ACE_MODES.get(Path(current).suffix.lower(), "text"),
+        theme=ace_theme,
+        keybinding="vscode",
+        font_size=14,
+        min_lines=20,
+        show_gutter=True,
+        wrap=True,
+        auto_update=True,
+        key=f"project_editor_{current}"
+    )
+
+    if code is not None and code != files[current]:
+        files[current] = code
+    # The assistant sees the file being edited; the single-file buffer stays untouched
+    st.session_state.project_code = files[current]
+
+    # ── Stdin Input ──────────────────────────────
+    _render_stdin()
+
+    # ── Run Button ──────────────────────────────
+    if st.button("▶️ Run Project"):
+        _run_and_report(lambda: execute_project(
+            files=files,
+            entry=entry,
+            stdin=st.session_state.stdin,
+            language=project_lang
+        ))
+
+    # ── Download Project ──────────────────────────────
+    st.download_button(
+        label="💾 Download Project",
+        data=build_project_archive(files),
+        file_name="project.zip",
+        mime="application/zip"
+    )
+
+def _guess_entry(files):
+    for name in ENTRY_CANDIDATES:
+        if name in files:
+            return name
+    sources = [path for path in sorted(files) if Path(path).suffix.lower() in EXT_LANG_MAP]
+    return sources[0] if sources else min(files, default=None)
+
+def _render_stdin():
+    user_input = st.text_area(
+        "📥 Input (stdin)",
+        value=st.session_state.stdin,
+        height=100,
+        placeholder="Enter input values, one per line",
+        key="stdin_input"
+    )
+    if user_input != st.session_state.stdin:
+        st.session_state.stdin = user_input
+
+def _run_and_report(run):
+    start_time = time.perf_counter()
+    process = psutil.Process()
+    mem_before = process.memory_info().rss
+
+    out, err, exc = run()
+
+    exec_time = time.perf_counter() - start_time
+    mem_after = process.memory_info().rss
+    mem_used = (mem_after - mem_before) / 1024
+
+    st.session_state.code_output = out
+    st.session_state.error_output = err or exc
+
+    st.text_area("📤 Output", out or "(no output)", height=120)
+    if err or exc:
+        st.error(err or exc)
+    st.markdown(f"⏱️ **Execution Time:** {exec_time:.4f}s")
+    st.markdown(f"💾 **Memory Used:** {mem_used:.2f} KB")
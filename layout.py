@@ -6,6 +6,9 @@ def init_session_state():
     st.session_state.setdefault("code", "")
     st.session_state.setdefault("stdin", "")
     st.session_state.setdefault("language", "Python")
+    st.session_state.setdefault("project_files", {})
+    st.session_state.setdefault("project_entry", None)
+    st.session_state.setdefault("project_code", "")
 
 def apply_theme():
     """Apply the selected theme and return color palette + ACE theme."""
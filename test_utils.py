@@ -0,0 +1,188 @@
+import os
+import shutil
+import time
+import zipfile
+from io import BytesIO
+
+import pytest
+
+import utils
+from utils import (
+    normalize_project_path,
+    _strip_common_root,
+    _translation_unit_hash,
+    build_project_archive,
+    execute_project,
+    load_project_archive,
+)
+
+needs_gcc = pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not available")
+
+MAIN_C = '#include <stdio.h>\n#include <cfg.h>\n#include "lib/add.h"\nint main(){printf("%d\\n", add(VAL, 1));}'
+ADD_C = '#include "add.h"\nint add(int a, int b){return a + b;}'
+
+
+@pytest.fixture
+def build_cache(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(utils, "BUILD_CACHE_DIR", str(cache))
+    return cache
+
+
+def _project(**overrides):
+    files = {"main.c": MAIN_C, "cfg.h": "#define VAL 1", "lib/add.h": "int add(int, int);", "lib/add.c": ADD_C}
+    files.update(overrides)
+    return files
+
+
+# --- Include hashing ---
+def test_hash_changes_with_quoted_include():
+    before = _translation_unit_hash("lib/add.c", _project(), "gcc")
+    after = _translation_unit_hash("lib/add.c", _project(**{"lib/add.h": "int add(int a, int b);"}), "gcc")
+    assert before != after
+
+
+def test_hash_changes_with_angle_include_from_project_root():
+    before = _translation_unit_hash("main.c", _project(), "gcc")
+    after = _translation_unit_hash("main.c", _project(**{"cfg.h": "#define VAL 2"}), "gcc")
+    assert before != after
+
+
+def test_hash_ignores_unrelated_files():
+    before = _translation_unit_hash("lib/add.c", _project(), "gcc")
+    after = _translation_unit_hash("lib/add.c", _project(**{"cfg.h": "#define VAL 2"}), "gcc")
+    assert before == after
+
+
+def test_hash_depends_on_compiler():
+    assert _translation_unit_hash("main.c", _project(), "gcc") != _translation_unit_hash("main.c", _project(), "g++")
+
+
+# --- Incremental builds ---
+@needs_gcc
+def test_header_edit_triggers_recompile(build_cache):
+    assert execute_project(_project(), "main.c", language="C") == ("2\n", "", None)
+    assert execute_project(_project(**{"cfg.h": "#define VAL 2"}), "main.c", language="C") == ("3\n", "", None)
+
+
+@needs_gcc
+def test_unchanged_units_are_reused(build_cache):
+    execute_project(_project(), "main.c", language="C")
+    cached = set(os.listdir(build_cache))
+    execute_project(_project(**{"lib/add.c": ADD_C.replace("a + b", "a + b + 10")}), "main.c", language="C")
+    assert len(set(os.listdir(build_cache)) - cached) == 1
+
+
+@needs_gcc
+@pytest.mark.skipif(shutil.which("g++") is None, reason="g++ not available")
+def test_cpp_project_compiles_c_units(build_cache):
+    files = {
+        "main.cpp": '#include <iostream>\nextern "C" int twice(int);\nint main(){std::cout << twice(21) << std::endl;}',
+        "twice.c": "int twice(int x){return 2 * x;}",
+    }
+    assert execute_project(files, "main.cpp", language="C++") == ("42\n", "", None)
+
+
+@needs_gcc
+def test_build_cache_is_pruned(build_cache, monkeypatch):
+    monkeypatch.setattr(utils, "MAX_CACHED_OBJECTS", 2)
+    for value in range(3):
+        execute_project(_project(**{"cfg.h": f"#define VAL {value}"}), "main.c", language="C")
+    assert len([name for name in os.listdir(build_cache) if name.endswith(".o")]) == 2
+
+
+# --- Project paths and archives ---
+@pytest.mark.parametrize("path, expected", [
+    ("src/main.c", "src/main.c"),
+    ("./x.h", "x.h"),
+    ("a/../b.h", "b.h"),
+    ("/abs/x.py", "abs/x.py"),
+    ("dir\\x.py", "dir/x.py"),
+])
+def test_normalize_project_path_normalizes(path, expected):
+    assert normalize_project_path(path) == expected
+
+
+@pytest.mark.parametrize("path", ["../x.c", "a/../../x.c", "", ".", "dir/"])
+def test_normalize_project_path_rejects(path):
+    with pytest.raises(ValueError):
+        normalize_project_path(path)
+
+
+def test_strip_common_root():
+    assert _strip_common_root({"proj/a.py": "", "proj/pkg/b.py": ""}, "proj") == {"a.py": "", "pkg/b.py": ""}
+    assert _strip_common_root({"a.py": "", "pkg/b.py": ""}, "proj") == {"a.py": "", "pkg/b.py": ""}
+
+
+def test_strip_common_root_keeps_unrelated_folder():
+    files = {"app/__main__.py": "", "app/util.py": ""}
+    assert _strip_common_root(files, "project") == files
+
+
+def test_load_folder_zip_strips_folder():
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("demo/main.py", "")
+        archive.writestr("demo/lib/util.py", "")
+    assert load_project_archive(buffer.getvalue(), "demo.zip") == {"main.py": "", "lib/util.py": ""}
+
+
+@pytest.mark.parametrize("files", [
+    {"main.py": "from pkg.mod import f", "pkg/__init__.py": "", "pkg/mod.py": "def f(): pass"},
+    {"app/__main__.py": "from app import util", "app/util.py": ""},
+    {"project/main.py": "", "project/util.py": ""},
+])
+def test_archive_round_trip(files):
+    assert load_project_archive(build_project_archive(files), "project.zip") == files
+
+
+def test_archive_rejects_oversized_contents(monkeypatch):
+    monkeypatch.setattr(utils, "MAX_PROJECT_BYTES", 1024)
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("big.txt", "0" * 4096)
+    with pytest.raises(ValueError):
+        load_project_archive(buffer.getvalue())
+
+
+def test_python_project_imports_within_tree():
+    files = {"main.py": "from pkg.mod import f\nprint(f(int(input())))", "pkg/__init__.py": "", "pkg/mod.py": "def f(x): return x * 2"}
+    assert execute_project(files, "main.py", "21", "Python") == ("42", "", None)
+
+
+def test_python_project_empty_stdin_hits_eof():
+    start = time.perf_counter()
+    out, err, exc = execute_project({"main.py": "print(input())"}, "main.py", "", "Python")
+    assert "EOFError" in err and exc is None
+    assert time.perf_counter() - start < 5
+
+
+@needs_gcc
+def test_c_project_empty_stdin_hits_eof(build_cache):
+    files = {"main.c": '#include <stdio.h>\nint main(){int a = 7; printf("%d\\n", scanf("%d", &a));}'}
+    assert execute_project(files, "main.c", "", "C") == ("-1\n", "", None)
+
+
+@needs_gcc
+def test_prune_removes_stale_partials(build_cache):
+    execute_project(_project(), "main.c", language="C")
+    stale, fresh = build_cache / "stale.o.tmp", build_cache / "fresh.o.tmp"
+    stale.write_bytes(b"")
+    fresh.write_bytes(b"")
+    old = time.time() - utils.STALE_PARTIAL_SECONDS - 1
+    os.utime(stale, (old, old))
+    utils._prune_build_cache(keep=[])
+    assert not stale.exists() and fresh.exists()
+
+
+def test_project_runs_never_inherit_server_stdin(monkeypatch):
+    calls = []
+    real_run = utils.subprocess.run
+
+    def spy(cmd, **kwargs):
+        calls.append(kwargs)
+        return real_run(cmd, **kwargs)
+
+    monkeypatch.setattr(utils.subprocess, "run", spy)
+    execute_project({"main.py": "print(input())"}, "main.py", "", "Python")
+    assert calls and all(kwargs["input"] == b"" for kwargs in calls)
@@ -1,14 +1,29 @@
 import os
+import re
 import sys
 import random
+import hashlib
+import zipfile
+import posixpath
 import tempfile
+import time
 import subprocess
 import requests
-from io import StringIO
+from io import StringIO, BytesIO
 from datetime import datetime
-from typing import Tuple
+from typing import Dict, List, Tuple
 import contextlib
 
+# Compiled objects are cached by content hash, so unchanged translation units
+# are reused across runs (and sessions) instead of being recompiled.
+BUILD_CACHE_DIR = os.path.join(tempfile.gettempdir(), "codecraft_build_cache")
+MAX_CACHED_OBJECTS = 500
+MAX_PROJECT_FILES = 200
+MAX_PROJECT_BYTES = 10 * 1024 * 1024
+STALE_PARTIAL_SECONDS = 10 * 60
+PROJECT_ARCHIVE_MARKER = b"codecraft-project"
+_INCLUDE_RE = re.compile(r'^\s*#\s*include\s*(["<])([^">]+)[">]', re.MULTILINE)
+
 # --- Utility context manager to capture stdout/stderr (for Python execution) ---
 @contextlib.contextmanager
 def capture_output():
@@ -78,13 +93,15 @@ def _compile_and_run(code: str, stdin: str, ext: str, compiler: str):
         return _run_subprocess([binary], stdin)
 
 # --- Run subprocess and capture output ---
-def _run_subprocess(cmd, stdin_input=None) -> Tuple[str, str, str]:
+def _run_subprocess(cmd, stdin_input=None, cwd=None, env=None) -> Tuple[str, str, str]:
     try:
         result = subprocess.run(
             cmd,
-            input=stdin_input.encode() if stdin_input else None,
+            input=stdin_input.encode() if stdin_input is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            cwd=cwd,
+            env=env,
             timeout=10
         )
         return result.stdout.decode(), result.stderr.decode(), None
@@ -93,22 +110,25 @@ def _run_subprocess(cmd, stdin_input=None) -> Tuple[str, str, str]:
 
 # --- Java, JS, C# via OneCompiler API ---
 def _execute_with_onecompiler(code: str, stdin: str, language: str, filename: str) -> Tuple[str, str, str]:
+    return _execute_files_with_onecompiler([{"name": filename, "content": code}], stdin, language)
+
+def _execute_files_with_onecompiler(files: List[dict], stdin: str, language: str) -> Tuple[str, str, str]:
     keys = [os.environ["ONECOMPILER_API_KEY"], os.environ["ONECOMPILER_API_KEY1"]]
     primary_key = random.choice(keys)
 
-    result = _call_onecompiler_api(primary_key, code, stdin, language, filename)
+    result = _call_onecompiler_api(primary_key, files, stdin, language)
 
     if _is_quota_or_invalid(result):
         for key in keys:
             if key == primary_key:
                 continue
-            result = _call_onecompiler_api(key, code, stdin, language, filename)
+            result = _call_onecompiler_api(key, files, stdin, language)
             if not _is_quota_or_invalid(result):
                 break
 
     return result
 
-def _call_onecompiler_api(key: str, code: str, stdin: str, language: str, filename: str) -> Tuple[str, str, str]:
+def _call_onecompiler_api(key: str, files: List[dict], stdin: str, language: str) -> Tuple[str, str, str]:
     url = "https://onecompiler-apis.p.rapidapi.com/api/v1/run"
     headers = {
         "Content-Type": "application/json",
@@ -118,7 +138,7 @@ def _call_onecompiler_api(key: str, code: str, stdin: str, language: str, filena
     payload = {
         "language": language.lower(),
         "stdin": stdin,
-        "files": [{"name": filename, "content": code}]
+        "files": files
     }
 
     try:
@@ -143,6 +163,175 @@ def _is_quota_or_invalid(result: Tuple[str, str, str]) -> bool:
     error = error.lower()
     return any(term in error for term in ["quota", "e002", "e003", "invalid", "exhausted"])
 
+# --- Project (multi-file) execution ---
+PROJECT_ONECOMPILER_LANGS = {"Java": "java", "JavaScript": "javascript", "C#": "csharp"}
+
+def execute_project(files: Dict[str, str], entry: str, stdin: str = "", language: str = "cpp") -> Tuple[str, str, str]:
+    try:
+        if entry not in files:
+            return "", "", f"Entry file not found in project: {entry}"
+        if language == "Python":
+            return _execute_python_project(files, entry, stdin)
+        elif language == "C":
+            return _build_and_run_project(files, stdin, compilers={".c": "gcc"}, linker="gcc")
+        elif language == "C++":
+            # Mixed projects are common: .c units are still compiled as C
+            compilers = {".cpp": "g++", ".cc": "g++", ".cxx": "g++", ".c": "gcc"}
+            return _build_and_run_project(files, stdin, compilers=compilers, linker="g++")
+        elif language in PROJECT_ONECOMPILER_LANGS:
+            # OneCompiler runs the first file, so the entry point goes first
+            ordered = [entry] + [path for path in sorted(files) if path != entry]
+            payload = [{"name": path, "content": files[path]} for path in ordered]
+            return _execute_files_with_onecompiler(payload, stdin, PROJECT_ONECOMPILER_LANGS[language])
+        else:
+            return "", f"Unsupported language: {language}", None
+    except Exception as e:
+        return "", "", str(e)
+
+def _write_project(files: Dict[str, str], root: str):
+    for path, content in files.items():
+        target = os.path.join(root, *normalize_project_path(path).split("/"))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "w") as f:
+            f.write(content)
+
+def normalize_project_path(path: str) -> str:
+    path = path.replace("\\", "/")
+    normalized = posixpath.normpath(path).lstrip("/")
+    if path.endswith("/") or normalized in ("", ".") or normalized.split("/")[0] == "..":
+        raise ValueError(f"Invalid project path: {path}")
+    return normalized
+
+# --- Python projects: run the entry file with the project root importable ---
+def _execute_python_project(files: Dict[str, str], entry: str, stdin: str) -> Tuple[str, str, str]:
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_project(files, tmp)
+        env = dict(os.environ, PYTHONPATH=tmp, PYTHONDONTWRITEBYTECODE="1")
+        script = os.path.join(tmp, *normalize_project_path(entry).split("/"))
+        out, err, exc = _run_subprocess([sys.executable, script], stdin, cwd=tmp, env=env)
+        return out.strip(), err.strip(), exc
+
+# --- C/C++ projects: compile changed translation units, then link ---
+def _build_and_run_project(files: Dict[str, str], stdin: str, compilers: Dict[str, str], linker: str):
+    units = sorted(path for path in files if posixpath.splitext(path)[1].lower() in compilers)
+    if not units:
+        return "", "", f"No {'/'.join(sorted(compilers))} source files in project"
+
+    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_project(files, tmp)
+
+        objects = []
+        for unit in units:
+            compiler = compilers[posixpath.splitext(unit)[1].lower()]
+            obj = os.path.join(BUILD_CACHE_DIR, f"{_translation_unit_hash(unit, files, compiler)}.o")
+            if os.path.exists(obj):
+                os.utime(obj)  # mark as recently used for eviction
+            else:
+                comp_out, comp_err, comp_exc = _compile_unit(unit, obj, tmp, compiler)
+                if comp_exc or not os.path.exists(obj):
+                    return comp_out, comp_err, comp_exc
+            objects.append(obj)
+
+        binary = os.path.join(tmp, "main.out")
+        link_out, link_err, link_exc = _run_subprocess([linker, *objects, "-o", binary])
+        _prune_build_cache(keep=objects)
+        if link_exc or not os.path.exists(binary):
+            return link_out, link_err, link_exc
+
+        return _run_subprocess([binary], stdin, cwd=tmp)
+
+def _compile_unit(unit: str, obj: str, root: str, compiler: str) -> Tuple[str, str, str]:
+    source = os.path.join(root, *normalize_project_path(unit).split("/"))
+    # Compile to a unique temp file and rename, so concurrent or failed builds
+    # never publish a partial object into the shared cache
+    fd, partial = tempfile.mkstemp(dir=BUILD_CACHE_DIR, suffix=".o.tmp")
+    os.close(fd)
+    try:
+        result = _run_subprocess([compiler, "-c", source, "-I", root, "-o", partial])
+        if os.path.getsize(partial) > 0:
+            os.replace(partial, obj)
+        return result
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+def _prune_build_cache(keep: List[str]):
+    """Evict the least recently used objects once the cache exceeds MAX_CACHED_OBJECTS."""
+    keep = set(keep)
+    try:
+        entries = list(os.scandir(BUILD_CACHE_DIR))
+        # Partial objects left behind by interrupted compiles
+        stale_before = time.time() - STALE_PARTIAL_SECONDS
+        for entry in entries:
+            if entry.name.endswith(".o.tmp") and entry.stat().st_mtime < stale_before:
+                os.remove(entry.path)
+        entries = [entry for entry in entries if entry.name.endswith(".o")]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[MAX_CACHED_OBJECTS:]:
+            if entry.path not in keep:
+                os.remove(entry.path)
+    except OSError:
+        pass  # another session may be pruning at the same time
+
+def _translation_unit_hash(unit: str, files: Dict[str, str], compiler: str) -> str:
+    """Hash a source file together with every project header it transitively includes."""
+    digest = hashlib.sha256(compiler.encode())
+    seen, pending = set(), [unit]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        digest.update(f"\0{path}\0".encode())
+        digest.update(files[path].encode())
+        base = posixpath.dirname(path)
+        for form, include in _INCLUDE_RE.findall(files[path]):
+            # "..." searches the including file's directory first; both forms then search the
+            # project root, which is passed to the compiler with -I
+            search = (posixpath.join(base, include), include) if form == '"' else (include,)
+            for candidate in search:
+                candidate = posixpath.normpath(candidate)
+                if candidate in files:
+                    pending.append(candidate)
+                    break
+    return digest.hexdigest()
+
+# --- Project archives (zip upload / download) ---
+def load_project_archive(data: bytes, filename: str = "") -> Dict[str, str]:
+    files = {}
+    with zipfile.ZipFile(BytesIO(data)) as archive:
+        entries = [info for info in archive.infolist() if not info.is_dir() and "__MACOSX" not in info.filename]
+        if len(entries) > MAX_PROJECT_FILES:
+            raise ValueError(f"Project has more than {MAX_PROJECT_FILES} files")
+        # Check the declared sizes before decompressing anything
+        if sum(info.file_size for info in entries) > MAX_PROJECT_BYTES:
+            raise ValueError(f"Project expands to more than {MAX_PROJECT_BYTES // (1024 * 1024)}MB")
+        for info in entries:
+            path = normalize_project_path(info.filename)
+            files[path] = archive.read(info).decode("utf-8", errors="ignore")
+        if archive.comment == PROJECT_ARCHIVE_MARKER:
+            # Our own downloads already hold the tree exactly as it was
+            return files
+    return _strip_common_root(files, posixpath.splitext(posixpath.basename(filename))[0])
+
+def _strip_common_root(files: Dict[str, str], folder: str) -> Dict[str, str]:
+    # Zipping "<folder>/" gives "<folder>.zip" with every path under "<folder>/"; drop that level.
+    # Other single top-level folders (e.g. a Python package) are part of the project.
+    roots = {path.split("/")[0] for path in files}
+    if roots == {folder} and all("/" in path for path in files):
+        prefix = len(roots.pop()) + 1
+        return {path[prefix:]: content for path, content in files.items()}
+    return files
+
+def build_project_archive(files: Dict[str, str]) -> bytes:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.comment = PROJECT_ARCHIVE_MARKER
+        for path in sorted(files):
+            archive.writestr(path, files[path])
+    return buffer.getvalue()
+
 # --- Export utility ---
 def export_session(code: str, output: str, error: str) -> dict:
     return {